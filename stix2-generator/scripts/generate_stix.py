@@ -9,95 +9,204 @@ Usage:
     python generate_stix.py --attack-pattern T1055 --output bundle.json
 """
 
+from __future__ import annotations
+
 import argparse
+import contextlib
+import functools
+import itertools
 import json
+import mmap
+import os
 import re
+import string
 import sys
 import uuid
+from collections import defaultdict
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# stix2 is slow to import, so it is imported where it is first needed;
+# argument errors and --help return without loading it
+if TYPE_CHECKING:
+    from stix2 import (
+        AttackPattern,
+        Bundle,
+        Campaign,
+        Identity,
+        Indicator,
+        Malware,
+        ThreatActor,
+    )
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-import stix2
-from stix2 import (
-    AttackPattern,
-    Bundle,
-    Campaign,
-    Identity,
-    Indicator,
-    Malware,
-    Relationship,
-    ThreatActor,
-    Tool,
-)
+# orjson turns integers beyond 64 bits into floats; any integer that might
+# not fit has at least 19 digits, so such files are left to json
+_LONG_DIGITS = re.compile(rb'[0-9]{19,}')
+
+
+@functools.lru_cache(maxsize=1)
+def _default_identity() -> Identity:
+    """Return the identity shared by generators created without one.
+    
+    STIX objects are immutable, so a single instance can be reused.
+    """
+    from stix2 import Identity
+    return Identity(
+        name="STIX Generator",
+        identity_class="system",
+        description="Automated STIX object generator"
+    )
+
+
+def _format_timestamp(value: datetime) -> str:
+    """Format a datetime as a STIX timestamp (UTC, millisecond precision)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+def _uuid4_stream(batch_size: int = 4096) -> Iterator[str]:
+    """Yield random UUID4 strings, reading randomness from os.urandom in batches."""
+    while True:
+        randomness = os.urandom(16 * batch_size)
+        for i in range(0, len(randomness), 16):
+            yield str(uuid.UUID(bytes=randomness[i:i + 16], version=4))
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert stix2 objects to plain dicts, lists and STIX timestamp strings.
+    
+    As in stix2's own serializer, optional properties that were only filled
+    in with their spec default (e.g. ``revoked: false``) are left out.
+    """
+    if isinstance(value, Mapping):
+        defaulted = getattr(value, "_defaulted_optional_properties", ())
+        return {
+            key: _to_plain(item)
+            for key, item in value.items()
+            if key not in defaulted
+        }
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, datetime):
+        from stix2.utils import format_datetime
+        return format_datetime(value)
+    return value
 
 
 class STIXGenerator:
     """Generate STIX 2.1 objects and bundles."""
     
-    # IOC patterns
-    IPV4_PATTERN = re.compile(r'^(?:[0-9]{1,3}\.){3}[0-9]{1,3}$')
-    IPV6_PATTERN = re.compile(r'^(?:[0-9a-fA-F]{0,4}:){7}[0-9a-fA-F]{0,4}$')
-    DOMAIN_PATTERN = re.compile(r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$')
-    MD5_PATTERN = re.compile(r'^[a-fA-F0-9]{32}$')
-    SHA1_PATTERN = re.compile(r'^[a-fA-F0-9]{40}$')
-    SHA256_PATTERN = re.compile(r'^[a-fA-F0-9]{64}$')
-    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    URL_PATTERN = re.compile(r'^https?://[^\s]+$')
+    # IOC patterns, matched in a single pass; the matching group names the type.
+    # Every alternative is free of nested quantifiers, so fullmatch runs in
+    # linear time on adversarial input. Keep it that way: domain-style label
+    # repetition is validated by _is_domain rather than by a regex.
+    IOC_PATTERN = re.compile(
+        r'(?P<ipv4>(?:[0-9]{1,3}\.){3}[0-9]{1,3})'
+        r'|(?P<ipv6>(?:[0-9a-fA-F]{0,4}:){7}[0-9a-fA-F]{0,4})'
+        r'|(?P<url>https?://[^\s]+)'
+        r'|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    )
     
-    # MITRE ATT&CK patterns
-    TECHNIQUE_PATTERN = re.compile(r'^T\d{4}(\.\d{3})?$')
+    # Hex digests are identified by length alone, then checked for hex digits
+    HASH_TYPES_BY_LENGTH = {32: "md5", 40: "sha1", 64: "sha256"}
+    HASH_TYPES = frozenset(HASH_TYPES_BY_LENGTH.values())
+    HEX_DIGITS = frozenset(string.hexdigits)
+    
+    # STIX patterning templates, filled with the IOC value
+    PATTERN_TEMPLATES = {
+        "ipv4": "[network-traffic:dst_ref.type = 'ipv4-addr' AND network-traffic:dst_ref.value = '{}']",
+        "ipv6": "[network-traffic:dst_ref.type = 'ipv6-addr' AND network-traffic:dst_ref.value = '{}']",
+        "domain": "[domain-name:value = '{}']",
+        "url": "[url:value = '{}']",
+        "email": "[email-addr:value = '{}']",
+        "md5": "[file:hashes.MD5 = '{}']",
+        "sha1": "[file:hashes.SHA-1 = '{}']",
+        "sha256": "[file:hashes.SHA-256 = '{}']",
+    }
+    
+    # IOC files at least this large are memory-mapped rather than read whole
+    MMAP_THRESHOLD = 16 * 1024 * 1024
     
     def __init__(self, identity: Optional[Identity] = None):
         """Initialize the generator with an optional identity."""
         self.identity = identity or self._create_default_identity()
         self.objects = []
+        self.raw_objects = []
         self.relationships = []
+        # Every generated object, bucketed by STIX type
+        self._by_type = defaultdict(list)
+        # IDs for fast-path objects, drawn from this generator's own random batches
+        self._uuids = _uuid4_stream()
+    
+    def _add(self, obj: Any) -> None:
+        """Record a generated STIX object or, for the fast path, a plain dict."""
+        if isinstance(obj, dict):
+            self.raw_objects.append(obj)
+        else:
+            self.objects.append(obj)
+        self._by_type[obj.get("type")].append(obj)
     
     def _create_default_identity(self) -> Identity:
         """Create a default identity for object creation."""
-        return Identity(
-            name="STIX Generator",
-            identity_class="system",
-            description="Automated STIX object generator"
-        )
+        return _default_identity()
     
     def detect_ioc_type(self, ioc: str) -> Optional[str]:
         """Detect the type of IOC from its format."""
-        ioc = ioc.strip()
+        return self._classify(ioc.strip())
+    
+    def _classify(self, ioc: str) -> Optional[str]:
+        """Detect the type of an already-stripped IOC."""
+        hash_type = self.HASH_TYPES_BY_LENGTH.get(len(ioc))
+        if hash_type and self.HEX_DIGITS.issuperset(ioc):
+            return hash_type
         
-        if self.IPV4_PATTERN.match(ioc):
-            return "ipv4"
-        elif self.IPV6_PATTERN.match(ioc):
-            return "ipv6"
-        elif self.DOMAIN_PATTERN.match(ioc):
+        match = self.IOC_PATTERN.fullmatch(ioc)
+        if match:
+            return match.lastgroup
+        elif self._is_domain(ioc):
             return "domain"
-        elif self.URL_PATTERN.match(ioc):
-            return "url"
-        elif self.EMAIL_PATTERN.match(ioc):
-            return "email"
-        elif self.MD5_PATTERN.match(ioc):
-            return "md5"
-        elif self.SHA1_PATTERN.match(ioc):
-            return "sha1"
-        elif self.SHA256_PATTERN.match(ioc):
-            return "sha256"
         else:
             return None
     
+    def _classify_batch(self, iocs: List[str]) -> List[Optional[str]]:
+        """Detect the types of a batch of already-stripped IOCs in one pass."""
+        return list(map(self._classify, iocs))
+    
+    @staticmethod
+    def _is_domain(ioc: str) -> bool:
+        """Check for a hostname with an alphabetic TLD, one label at a time.
+        
+        Splitting on dots keeps this linear in the input length, unlike a
+        nested-quantifier regex which backtracks on long label-like runs.
+        """
+        if not ioc.isascii():
+            return False
+        labels = ioc.split('.')
+        tld = labels[-1]
+        if len(labels) < 2 or len(tld) < 2 or not tld.isalpha():
+            return False
+        return all(
+            0 < len(label) <= 63
+            and label[0].isalnum()
+            and label[-1].isalnum()
+            and label.replace('-', '').isalnum()
+            for label in labels[:-1]
+        )
+    
     def create_indicator_pattern(self, ioc: str, ioc_type: str) -> str:
         """Create a STIX pattern from an IOC."""
-        patterns = {
-            "ipv4": f"[network-traffic:dst_ref.type = 'ipv4-addr' AND network-traffic:dst_ref.value = '{ioc}']",
-            "ipv6": f"[network-traffic:dst_ref.type = 'ipv6-addr' AND network-traffic:dst_ref.value = '{ioc}']",
-            "domain": f"[domain-name:value = '{ioc}']",
-            "url": f"[url:value = '{ioc}']",
-            "email": f"[email-addr:value = '{ioc}']",
-            "md5": f"[file:hashes.MD5 = '{ioc.lower()}']",
-            "sha1": f"[file:hashes.SHA-1 = '{ioc.lower()}']",
-            "sha256": f"[file:hashes.SHA-256 = '{ioc.lower()}']",
-        }
-        return patterns.get(ioc_type, f"[{ioc_type}:value = '{ioc}']")
+        template = self.PATTERN_TEMPLATES.get(ioc_type)
+        if not template:
+            return f"[{ioc_type}:value = '{ioc}']"
+        return template.format(ioc.lower() if ioc_type in self.HASH_TYPES else ioc)
     
     def generate_indicator(
         self,
@@ -107,10 +216,67 @@ class STIXGenerator:
         valid_from: Optional[datetime] = None,
         valid_until: Optional[datetime] = None,
         confidence: int = 75,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        ioc_type: Optional[str] = None
     ) -> Optional[Indicator]:
-        """Generate an indicator from an IOC."""
-        ioc_type = self.detect_ioc_type(ioc)
+        """Generate an indicator from an IOC.
+        
+        ``ioc_type`` may be passed when the IOC has already been classified.
+        """
+        kwargs = self._indicator_kwargs(
+            ioc, labels, pattern_type, valid_from, valid_until, confidence, description, ioc_type
+        )
+        if kwargs is None:
+            return None
+        
+        from stix2 import Indicator
+        return Indicator(**kwargs)
+    
+    def generate_indicator_dict(
+        self,
+        ioc: str,
+        created: Optional[datetime] = None,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """Generate an indicator as a plain STIX JSON dict.
+        
+        Takes the same arguments as generate_indicator, plus the creation
+        time, but skips stix2 object construction and its per-object
+        validation, which dominates the cost of large IOC lists.
+        """
+        fields = self._indicator_kwargs(ioc, **kwargs)
+        if fields is None:
+            return None
+        
+        now = _format_timestamp(created or datetime.now(timezone.utc))
+        indicator = {
+            "type": "indicator",
+            "spec_version": "2.1",
+            "id": f"indicator--{next(self._uuids)}",
+            "created": now,
+            "modified": now,
+        }
+        indicator.update(fields)
+        indicator["valid_from"] = _format_timestamp(fields["valid_from"])
+        if "valid_until" in fields:
+            indicator["valid_until"] = _format_timestamp(fields["valid_until"])
+        
+        return indicator
+    
+    def _indicator_kwargs(
+        self,
+        ioc: str,
+        labels: List[str] = None,
+        pattern_type: str = "stix",
+        valid_from: Optional[datetime] = None,
+        valid_until: Optional[datetime] = None,
+        confidence: int = 75,
+        description: Optional[str] = None,
+        ioc_type: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Build the indicator properties for an IOC, or None if its type is unknown."""
+        if not ioc_type:
+            ioc_type = self.detect_ioc_type(ioc)
         if not ioc_type:
             print(f"Warning: Could not detect IOC type for: {ioc}", file=sys.stderr)
             return None
@@ -141,27 +307,83 @@ class STIXGenerator:
         if valid_until:
             kwargs["valid_until"] = valid_until
         
-        return Indicator(**kwargs)
+        return kwargs
     
     def generate_indicators_from_file(
         self,
         filepath: Path,
+        fast: bool = False,
         **kwargs
-    ) -> List[Indicator]:
-        """Generate indicators from a file containing IOCs."""
+    ) -> List[Union[Indicator, Dict[str, Any]]]:
+        """Generate indicators from a file containing IOCs.
+        
+        With ``fast``, indicators are built as plain dicts by
+        generate_indicator_dict and kept apart from the stix2 objects.
+        The clock is read once: indicators without an explicit
+        ``valid_from`` all share the file's ingest time.
+        """
         indicators = []
+        iocs = self._read_iocs(filepath)
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                ioc = line.strip()
-                if ioc and not ioc.startswith('#'):
-                    indicator = self.generate_indicator(ioc, **kwargs)
-                    if indicator:
-                        indicators.append(indicator)
-                        self.objects.append(indicator)
+        now = datetime.now(timezone.utc)
+        if not kwargs.get("valid_from"):
+            kwargs["valid_from"] = now
+        
+        if fast:
+            generate = functools.partial(self.generate_indicator_dict, created=now)
+        else:
+            generate = self.generate_indicator
+        
+        for ioc, ioc_type in zip(iocs, self._classify_batch(iocs)):
+            indicator = generate(ioc, ioc_type=ioc_type, **kwargs)
+            if indicator:
+                indicators.append(indicator)
+                self._add(indicator)
         
         return indicators
     
+    @staticmethod
+    def _is_technique_id(technique_id: str) -> bool:
+        """Check for a MITRE ATT&CK ID of the form T1234 or T1234.567."""
+        n = len(technique_id)
+        return (
+            (n == 5 or n == 9)
+            and technique_id[0] == 'T'
+            and technique_id[1:5].isdecimal()
+            and (n == 5 or (technique_id[5] == '.' and technique_id[6:].isdecimal()))
+        )
+    
+    def _read_iocs(self, filepath: Path) -> List[str]:
+        """Read the unique IOCs in a file, skipping blank and comment lines.
+        
+        Hashes are lowercased first so case variants of one digest only
+        produce a single indicator.
+        """
+        lines = map(str.strip, self._iter_lines(filepath))
+        iocs = (ioc for ioc in lines if ioc and not ioc.startswith('#'))
+        return list(dict.fromkeys(map(self._normalize_ioc, iocs)))
+    
+    def _normalize_ioc(self, ioc: str) -> str:
+        """Lowercase hash IOCs; other IOCs are returned unchanged."""
+        if len(ioc) in self.HASH_TYPES_BY_LENGTH and self.HEX_DIGITS.issuperset(ioc):
+            return ioc.lower()
+        return ioc
+    
+    def _iter_lines(self, filepath: Path) -> Iterator[str]:
+        """Yield the lines of a text file.
+        
+        Large files are memory-mapped and decoded a line at a time so the
+        file is never copied into memory as a whole.
+        """
+        with open(filepath, 'rb', buffering=1 << 20) as f:
+            if os.fstat(f.fileno()).st_size < self.MMAP_THRESHOLD:
+                yield from f.read().decode('utf-8', 'replace').split('\n')
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b''):
+                    yield line.decode('utf-8', 'replace')
+    
     def generate_attack_pattern(
         self,
         technique_id: str,
@@ -169,7 +391,7 @@ class STIXGenerator:
         description: Optional[str] = None
     ) -> Optional[AttackPattern]:
         """Generate an attack pattern from a MITRE ATT&CK technique ID."""
-        if not self.TECHNIQUE_PATTERN.match(technique_id):
+        if not self._is_technique_id(technique_id):
             print(f"Warning: Invalid MITRE ATT&CK technique ID: {technique_id}", file=sys.stderr)
             return None
         
@@ -179,6 +401,7 @@ class STIXGenerator:
         if not description:
             description = f"Attack pattern based on MITRE ATT&CK technique {technique_id}"
         
+        from stix2 import AttackPattern
         attack_pattern = AttackPattern(
             name=name,
             description=description,
@@ -192,7 +415,7 @@ class STIXGenerator:
             created_by_ref=self.identity.id
         )
         
-        self.objects.append(attack_pattern)
+        self._add(attack_pattern)
         return attack_pattern
     
     def generate_malware(self, config: Dict[str, Any]) -> Malware:
@@ -214,8 +437,9 @@ class STIXGenerator:
         if "aliases" in config:
             kwargs["aliases"] = config["aliases"]
         
+        from stix2 import Malware
         malware = Malware(**kwargs)
-        self.objects.append(malware)
+        self._add(malware)
         return malware
     
     def generate_threat_actor(self, config: Dict[str, Any]) -> ThreatActor:
@@ -237,8 +461,9 @@ class STIXGenerator:
             if field in config:
                 kwargs[field] = config[field]
         
+        from stix2 import Relationship, ThreatActor
         threat_actor = ThreatActor(**kwargs)
-        self.objects.append(threat_actor)
+        self._add(threat_actor)
         
         # Generate attack patterns for observed TTPs
         if "observed_ttps" in config:
@@ -253,7 +478,7 @@ class STIXGenerator:
                         created_by_ref=self.identity.id
                     )
                     self.relationships.append(rel)
-                    self.objects.append(rel)
+                    self._add(rel)
         
         return threat_actor
     
@@ -274,8 +499,9 @@ class STIXGenerator:
                 else:
                     kwargs[field] = config[field]
         
+        from stix2 import Campaign, Relationship
         campaign = Campaign(**kwargs)
-        self.objects.append(campaign)
+        self._add(campaign)
         
         # Generate related objects
         if "threat_actor" in config:
@@ -287,7 +513,7 @@ class STIXGenerator:
                 created_by_ref=self.identity.id
             )
             self.relationships.append(rel)
-            self.objects.append(rel)
+            self._add(rel)
         
         if "malware" in config:
             for malware_config in config.get("malware", []):
@@ -299,40 +525,72 @@ class STIXGenerator:
                     created_by_ref=self.identity.id
                 )
                 self.relationships.append(rel)
-                self.objects.append(rel)
+                self._add(rel)
         
         return campaign
     
     def create_bundle(self, spec_version: str = "2.1") -> Bundle:
-        """Create a STIX bundle from generated objects."""
-        return Bundle(objects=self.objects)
-    
-    def validate_bundle(self, bundle: Bundle) -> Tuple[bool, List[str]]:
-        """Validate a STIX bundle."""
+        """Create a STIX bundle from generated objects.
+        
+        Plain dict objects from the fast path are parsed by stix2 here; use
+        emit_bundle to write them without that cost.
+        """
+        from stix2 import Bundle
+        return Bundle(objects=self.objects + self.raw_objects)
+    
+    def validate_bundle(self, bundle: Optional[Bundle] = None) -> Tuple[bool, List[str]]:
+        """Validate a STIX bundle, or the generator's own objects if none is given."""
+        if bundle is None:
+            errors = self._validate_objects()
+            return len(errors) == 0, errors
+        
         errors = []
         
         try:
-            # Basic validation
-            bundle_dict = json.loads(bundle.serialize())
-            
-            # Check required fields
-            if "type" not in bundle_dict or bundle_dict["type"] != "bundle":
+            # Walk the bundle's objects directly instead of re-parsing its JSON
+            if bundle.get("type") != "bundle":
                 errors.append("Invalid bundle type")
             
-            if "objects" not in bundle_dict or not bundle_dict["objects"]:
+            objects = bundle.get("objects")
+            if not objects:
                 errors.append("Bundle has no objects")
             
             # Validate each object
-            for obj in bundle_dict.get("objects", []):
-                if "type" not in obj:
-                    errors.append(f"Object missing type: {obj.get('id', 'unknown')}")
-                if "id" not in obj:
-                    errors.append(f"Object missing id: {obj.get('type', 'unknown')}")
+            for obj in objects or []:
+                self._check_object(obj, errors)
             
             return len(errors) == 0, errors
         except Exception as e:
             return False, [str(e)]
     
+    def _validate_objects(self) -> List[str]:
+        """Validate generated objects one type bucket at a time.
+        
+        Objects in a bucket share their type, so the type check is made
+        once per bucket rather than once per object.
+        """
+        errors = []
+        
+        if not self._by_type:
+            errors.append("Bundle has no objects")
+        
+        for object_type, objects in self._by_type.items():
+            if not object_type:
+                errors.extend(f"Object missing type: {obj.get('id', 'unknown')}" for obj in objects)
+            errors.extend(
+                f"Object missing id: {object_type or 'unknown'}" for obj in objects if "id" not in obj
+            )
+        
+        return errors
+    
+    @staticmethod
+    def _check_object(obj: Any, errors: List[str]) -> None:
+        """Append errors for a STIX object missing its type or id."""
+        if "type" not in obj:
+            errors.append(f"Object missing type: {obj.get('id', 'unknown')}")
+        if "id" not in obj:
+            errors.append(f"Object missing id: {obj.get('type', 'unknown')}")
+    
     def save_bundle(
         self,
         bundle: Bundle,
@@ -344,24 +602,68 @@ class STIXGenerator:
         if format == "json":
             output = bundle.serialize(pretty=pretty)
         elif format == "yaml":
-            # Would need PyYAML for this
-            bundle_dict = json.loads(bundle.serialize())
             import yaml
-            output = yaml.dump(bundle_dict, default_flow_style=False)
+            # Prefer the libyaml-backed dumper when PyYAML was built with it
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            output = yaml.dump(_to_plain(bundle), Dumper=dumper, default_flow_style=False)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write(output)
         else:
             print(output)
+    
+    def emit_bundle(
+        self,
+        output_path: Optional[Path] = None,
+        validate: bool = False,
+        pretty: bool = True
+    ) -> List[str]:
+        """Optionally validate, then serialize and write the JSON bundle in one pass.
+        
+        Each object is serialized once and written straight to the output
+        file (or stdout), so the bundle is never held in memory as a whole.
+        Objects are written compactly; ``pretty`` puts each on its own line.
+        
+        Returns the validation errors; nothing is written if there are any.
+        """
+        if validate:
+            errors = self._validate_objects()
+            if errors:
+                return errors
+        
+        separator = b",\n" if pretty else b","
+        objects = itertools.chain(self.objects, self.raw_objects)
+        
+        if output_path:
+            stream = open(output_path, 'wb', buffering=1 << 20)
+        else:
+            stream = contextlib.nullcontext(sys.stdout.buffer)
+        
+        with stream as f:
+            f.write(f'{{"type": "bundle", "id": "bundle--{uuid.uuid4()}", "objects": ['.encode('utf-8'))
+            for i, obj in enumerate(objects):
+                if i:
+                    f.write(separator)
+                if isinstance(obj, dict):
+                    f.write(json.dumps(obj).encode('utf-8'))
+                else:
+                    f.write(obj.serialize().encode('utf-8'))
+            f.write(b']}\n')
+            f.flush()
+        
+        return []
 
 
 def load_json_file(filepath: Path) -> Dict[str, Any]:
     """Load and parse a JSON file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    if _LONG_DIGITS.search(raw):
+        return json.loads(raw)
+    return json_loads(raw)
 
 
 def main():
@@ -436,6 +738,11 @@ def main():
         "--description",
         help="Description for generated objects"
     )
+    config_group.add_argument(
+        "--fast",
+        action="store_true",
+        help="Build indicators as plain JSON, skipping stix2 object validation"
+    )
     
     # Output options
     output_group = parser.add_argument_group("Output Options")
@@ -470,7 +777,7 @@ def main():
         "--pretty",
         action="store_true",
         default=True,
-        help="Pretty print output"
+        help="Write each JSON bundle object on its own line (default; objects stay compact)"
     )
     
     # Interactive mode
@@ -490,6 +797,7 @@ def main():
     # Create identity if specified
     identity = None
     if args.identity:
+        from stix2 import Identity
         identity = Identity(
             name=args.identity,
             identity_class="organization"
@@ -521,7 +829,8 @@ def main():
             valid_from=valid_from,
             valid_until=valid_until,
             confidence=args.confidence,
-            description=args.description
+            description=args.description,
+            fast=args.fast
         )
         print(f"Generated {len(indicators)} indicators", file=sys.stderr)
     
@@ -565,29 +874,38 @@ def main():
         print("Interactive mode not yet implemented", file=sys.stderr)
         return 1
     
-    # Create bundle
-    bundle = generator.create_bundle()
-    
-    # Validate if requested
     if args.validate:
         print("Validating bundle...", file=sys.stderr)
-        is_valid, errors = generator.validate_bundle(bundle)
-        if not is_valid:
-            print("Validation errors:", file=sys.stderr)
-            for error in errors:
-                print(f"  - {error}", file=sys.stderr)
-            return 1
-        print("✅ Bundle is valid", file=sys.stderr)
     
-    # Save bundle
-    generator.save_bundle(
-        bundle,
-        output_path=args.output,
-        format=args.format,
-        pretty=args.pretty
-    )
+    if args.format == "json":
+        # Serialize, validate and write each object in a single pass
+        errors = generator.emit_bundle(
+            args.output,
+            validate=args.validate,
+            pretty=args.pretty
+        )
+    else:
+        bundle = generator.create_bundle()
+        errors = generator.validate_bundle()[1] if args.validate else []
+        if not errors:
+            generator.save_bundle(
+                bundle,
+                output_path=args.output,
+                format=args.format,
+                pretty=args.pretty
+            )
+    
+    if errors:
+        print("Validation errors:", file=sys.stderr)
+        for error in errors:
+            print(f"  - {error}", file=sys.stderr)
+        return 1
+    
+    if args.validate:
+        print("✅ Bundle is valid", file=sys.stderr)
     
-    print(f"✅ Generated bundle with {len(generator.objects)} objects", file=sys.stderr)
+    object_count = len(generator.objects) + len(generator.raw_objects)
+    print(f"✅ Generated bundle with {object_count} objects", file=sys.stderr)
     return 0
 
 
@@ -12,19 +12,70 @@ Options:
     --recursive       Recursively validate files in directories
     --json            Output results as JSON
     --quiet           Only show errors, suppress success messages
+    --jobs N          Number of worker processes for directories
 """
 
 import argparse
+import functools
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from stix2validator import validate_file, ValidationOptions
+from stix2validator import validator as _validator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
+
+def dumps_json(data) -> str:
+    """Serialize data as 2-space indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def _cache_schema_loading() -> None:
+    """Reuse stix2validator's loaded schemas across objects and files.
+    
+    The library reads and compiles a JSON schema for every object it
+    validates. Schemas do not change during a run, so each schema file is
+    loaded and compiled once per process. This is a no-op if the library
+    does not expose the expected loaders.
+    """
+    load_schema = getattr(_validator, "load_schema", None)
+    load_validator = getattr(_validator, "load_validator", None)
+    if load_schema is None or load_validator is None:
+        return
+    
+    validators = {}
+    
+    def cached_load_validator(schema_path, schema, *args):
+        # Newer releases also pass schema_dir; forward whatever the library
+        # passes and key on everything except the (unhashable) schema itself
+        key = (schema_path,) + args
+        if key not in validators:
+            validators[key] = load_validator(schema_path, schema, *args)
+        return validators[key]
+    
+    _validator.load_schema = functools.lru_cache(maxsize=None)(load_schema)
+    _validator.load_validator = cached_load_validator
+
+
+_cache_schema_loading()
+
+
+@functools.lru_cache(maxsize=None)
 def create_options(strict: bool = False, enforce_refs: bool = False) -> ValidationOptions:
-    """Create validation options for STIX 2.1."""
+    """Create validation options for STIX 2.1.
+    
+    Options are cached and shared, so callers must not modify them.
+    """
     return ValidationOptions(
         version="2.1",
         strict=strict,
@@ -94,6 +145,29 @@ def validate_single_file(
     return output["valid"], output
 
 
+def _iter_json_files(root: Path, recursive: bool = False) -> Iterator[str]:
+    """Yield paths of JSON files under root using a single scandir per directory."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    yield entry.path
+
+
+def _validate_worker(filepath: Path, strict: bool, enforce_refs: bool) -> tuple[bool, dict]:
+    """Validate one file in a worker process without printing.
+    
+    Options are rebuilt from plain values so only picklable arguments
+    cross the process boundary.
+    """
+    options = create_options(strict=strict, enforce_refs=enforce_refs)
+    return validate_single_file(filepath, options, quiet=True)
+
+
 def print_results(filepath: Path, output: dict) -> None:
     """Print formatted validation results."""
     status = "✅ VALID" if output["valid"] else "❌ INVALID"
@@ -116,10 +190,14 @@ def validate_directory(
     recursive: bool = False,
     output_json: bool = False,
     quiet: bool = False,
+    max_workers: Optional[int] = None,
 ) -> tuple[bool, list[dict]]:
-    """Validate all STIX JSON files in a directory."""
-    pattern = "**/*.json" if recursive else "*.json"
-    files = list(dirpath.glob(pattern))
+    """Validate all STIX JSON files in a directory.
+    
+    Files are validated in parallel across worker processes; results are
+    reported in sorted file order.
+    """
+    files = sorted(map(Path, _iter_json_files(dirpath, recursive)))
     
     if not files:
         print(f"No JSON files found in {dirpath}")
@@ -128,11 +206,19 @@ def validate_directory(
     all_valid = True
     all_results = []
     
-    for filepath in sorted(files):
-        is_valid, result = validate_single_file(filepath, options, output_json, quiet)
-        all_results.append(result)
-        if not is_valid:
-            all_valid = False
+    worker = functools.partial(
+        _validate_worker,
+        strict=options.strict,
+        enforce_refs=options.enforce_refs,
+    )
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for filepath, (is_valid, result) in zip(files, executor.map(worker, files, chunksize=8)):
+            if not output_json and not quiet:
+                print_results(filepath, result)
+            all_results.append(result)
+            if not is_valid:
+                all_valid = False
     
     return all_valid, all_results
 
@@ -173,9 +259,18 @@ def main() -> int:
         action="store_true",
         help="Only show errors, suppress success messages",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for directory validation (default: CPU count)",
+    )
     
     args = parser.parse_args()
     
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    
     if not args.path.exists():
         print(f"Error: Path not found: {args.path}", file=sys.stderr)
         return 1
@@ -187,13 +282,13 @@ def main() -> int:
             args.path, options, args.json, args.quiet
         )
         if args.json:
-            print(json.dumps(results, indent=2))
+            print(dumps_json(results))
     else:
         is_valid, results = validate_directory(
-            args.path, options, args.recursive, args.json, args.quiet
+            args.path, options, args.recursive, args.json, args.quiet, args.jobs
         )
         if args.json:
-            print(json.dumps({"results": results, "all_valid": is_valid}, indent=2))
+            print(dumps_json({"results": results, "all_valid": is_valid}))
     
     if not args.json:
         print(f"\n{'='*50}")
@@ -0,0 +1,69 @@
+"""
+Byte-level feature kernels for skill implementations.
+
+scan_bytes computes a byte histogram and Shannon entropy in a single pass.
+When numba and numpy are installed the loop is JIT-compiled to native code
+(releasing the GIL, so it also scales across threads); otherwise a
+pure-Python implementation is used.
+"""
+
+import math
+from collections import Counter
+from typing import List, Tuple, Union
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None  # type: ignore[assignment]
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _scan_bytes_jit(buf):
+        histogram = np.zeros(256, dtype=np.int64)
+        for byte in buf:
+            histogram[byte] += 1
+
+        entropy = 0.0
+        for count in histogram:
+            if count:
+                p = count / buf.size
+                entropy -= p * np.log2(p)
+        return histogram, entropy
+
+    # Compile at import so the first payload does not pay the JIT cost
+    _scan_bytes_jit(np.zeros(1, dtype=np.uint8))
+
+
+def _scan_bytes_py(buf: Union[bytes, bytearray]) -> Tuple[List[int], float]:
+    """Pure-Python fallback for scan_bytes."""
+    counts = Counter(buf)
+    histogram = [counts.get(byte, 0) for byte in range(256)]
+
+    entropy = 0.0
+    for count in counts.values():
+        p = count / len(buf)
+        entropy -= p * math.log2(p)
+    return histogram, entropy
+
+
+def scan_bytes(buf: Union[bytes, bytearray]) -> Tuple[List[int], float]:
+    """
+    Compute the byte histogram and Shannon entropy of a payload.
+
+    Args:
+        buf: Payload bytes
+
+    Returns:
+        Tuple of (256-entry byte histogram, entropy in bits per byte)
+    """
+    if not buf:
+        return [0] * 256, 0.0
+
+    if njit is not None:
+        histogram, entropy = _scan_bytes_jit(np.frombuffer(buf, dtype=np.uint8))
+        return histogram.tolist(), float(entropy)
+
+    return _scan_bytes_py(buf)
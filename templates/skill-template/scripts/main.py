@@ -13,11 +13,52 @@ Example:
 """
 
 import argparse
+import collections
+import copy
+import csv
+import hashlib
+import itertools
 import json
 import logging
+import math
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any, BinaryIO, Callable, Deque, Dict, FrozenSet, Iterable, Iterator, List,
+    Optional, TextIO, Tuple, Union
+)
+
+from _kernels import scan_bytes
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# JSON inputs at least this large are streamed item by item when ijson is installed
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+# Smaller JSON inputs above this size are memory-mapped when orjson is installed
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# orjson has no arbitrary-precision integers and turns those beyond 64 bits
+# into floats; any integer that might not fit has at least 19 digits
+_LONG_DIGITS = re.compile(rb'[0-9]{19,}')
+
+# bytes.translate table mapping ASCII uppercase letters to lowercase
+_ASCII_LOWER = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +73,31 @@ class SkillTemplateError(Exception):
     pass
 
 
+# Slotted dataclasses are smaller and faster to create, but need Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ItemResult:
+    """Analysis result for a single item."""
+    item_id: str
+    status: str = "success"
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ErrorInfo:
+    """Error raised while processing a single item."""
+    item_id: str
+    error_type: str
+    message: str
+
+
+# Outcome of processing one item: its index and its result or error message
+_Outcome = Tuple[int, Union[ItemResult, str]]
+
+
 class SkillTemplate:
     """
     Template class for cybersecurity skills.
@@ -39,9 +105,35 @@ class SkillTemplate:
     Replace this with your actual skill implementation.
     """
     
-    def __init__(self, debug: bool = False):
-        """Initialize the skill."""
-        self.debug = debug
+    # Top-level fields the input must contain (replace with actual required fields)
+    _REQUIRED_FIELDS: FrozenSet[str] = frozenset({"example_field"})
+    
+    # Keywords flagged by the example analysis, matched case-insensitively
+    # against the lowercased UTF-8 repr of each item
+    _KEYWORDS: Tuple[bytes, ...] = (b"security_issue", b"security issue")
+    
+    # Maximum number of distinct items whose results are memoized
+    _CACHE_SIZE: int = 65536
+    
+    # Items sent to a worker process at a time, amortizing IPC overhead
+    _CHUNK_SIZE: int = 256
+    
+    # Item errors recorded individually; any further ones are only counted
+    _MAX_ERRORS: int = 1000
+    
+    def __init__(self, debug: bool = False, workers: int = 1, strict: bool = False) -> None:
+        """
+        Initialize the skill.
+        
+        Args:
+            debug: Enable debug logging
+            workers: Worker processes for item analysis; 1 analyzes in-process
+            strict: Abort on the first item error instead of recording it
+        """
+        self.debug: bool = debug
+        self.workers: int = workers
+        self.strict: bool = strict
+        self._cache: Dict[bytes, Dict[str, Any]] = {}
         if debug:
             logging.getLogger().setLevel(logging.DEBUG)
             logger.debug("Debug mode enabled")
@@ -66,35 +158,72 @@ class SkillTemplate:
         if not isinstance(data, dict):
             raise SkillTemplateError("Input must be a JSON object")
         
-        # Check for required fields
-        required_fields = ["example_field"]  # Replace with actual required fields
-        for field in required_fields:
-            if field not in data:
-                raise SkillTemplateError(f"Missing required field: {field}")
+        # Check for required fields, reporting every missing one at once
+        missing = self._REQUIRED_FIELDS.difference(data)
+        if missing:
+            raise SkillTemplateError(f"Missing required fields: {sorted(missing)}")
         
         logger.debug("Input validation passed")
         return True
     
-    def analyze(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze(
+        self,
+        data: Dict[str, Any],
+        result_sink: Optional[Callable[[ItemResult], None]] = None
+    ) -> Dict[str, Any]:
         """
         Main analysis function.
         
         Args:
-            data: Input data to analyze
+            data: Input data to analyze; ``items`` may be any iterable,
+                including a lazy stream from load_input
+            result_sink: If given, each item result is passed to it as soon
+                as it is ready instead of being kept in ``results``
             
         Returns:
             Analysis results
             
         Raises:
-            SkillTemplateError: If analysis fails
+            SkillTemplateError: If validation or analysis fails
         """
-        logger.info("Starting analysis")
-        
         # Validate input first
         self.validate_input(data)
         
+        return self._analyze_impl(data, result_sink)
+    
+    def analyze_validated(
+        self,
+        data: Dict[str, Any],
+        result_sink: Optional[Callable[[ItemResult], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze data the caller has already passed through validate_input.
+        
+        Pipelines that re-run analysis on subsets of validated input use
+        this to skip repeating the validation.
+        
+        Args:
+            data: Validated input data to analyze
+            result_sink: As for analyze
+            
+        Returns:
+            Analysis results
+            
+        Raises:
+            SkillTemplateError: If analysis fails
+        """
+        return self._analyze_impl(data, result_sink)
+    
+    def _analyze_impl(
+        self,
+        data: Dict[str, Any],
+        result_sink: Optional[Callable[[ItemResult], None]]
+    ) -> Dict[str, Any]:
+        """Run the analysis without validating the input."""
+        logger.info("Starting analysis")
+        
         # Initialize results structure
-        results = {
+        results: Dict[str, Any] = {
             "metadata": {
                 "skill": "skill-template",
                 "version": "1.0.0",
@@ -118,27 +247,36 @@ class SkillTemplate:
             
             # Simulate processing items
             items = data.get("items", [data])  # Handle single item or list
-            results["summary"]["total_items"] = len(items)
+            chunks = _chunked(enumerate(items), self._CHUNK_SIZE)
             
-            for i, item in enumerate(items):
-                try:
-                    # Process individual item
-                    item_result = self._process_item(item, i)
-                    results["results"].append(item_result)
-                    results["summary"]["processed"] += 1
-                    
-                    if item_result.get("status") == "warning":
-                        results["summary"]["warnings"] += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error processing item {i}: {e}")
-                    error_info = {
-                        "item_id": f"item-{i}",
-                        "error_type": "processing_error",
-                        "message": str(e)
-                    }
-                    results["errors"].append(error_info)
-                    results["summary"]["errors"] += 1
+            # Preallocate result slots when the item count is known up front
+            preallocated = result_sink is None and isinstance(items, list)
+            if preallocated:
+                results["results"] = [None] * len(items)
+            
+            if self.workers > 1:
+                with ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    # Workers get a copy of this instance, so subclass
+                    # overrides and instance state apply there too
+                    initargs=(self,),
+                ) as executor:
+                    # Bounded submission keeps a streamed input lazy
+                    chunk_outcomes = _map_bounded(
+                        executor, chunks, window=2 * self.workers
+                    )
+                    self._record_outcomes(
+                        chunk_outcomes, results, preallocated, result_sink
+                    )
+            else:
+                self._record_outcomes(
+                    map(self._process_chunk, chunks), results, preallocated, result_sink
+                )
+            
+            if preallocated and results["summary"]["errors"]:
+                # Drop the slots left empty by failed items
+                results["results"] = [r for r in results["results"] if r is not None]
             
             logger.info(f"Analysis complete. Processed {results['summary']['processed']} items")
             
@@ -148,10 +286,114 @@ class SkillTemplate:
         
         return results
     
-    def _process_item(self, item: Dict[str, Any], index: int) -> Dict[str, Any]:
+    def _record_outcomes(
+        self,
+        chunk_outcomes: Iterable[List[_Outcome]],
+        results: Dict[str, Any],
+        preallocated: bool = False,
+        result_sink: Optional[Callable[[ItemResult], None]] = None
+    ) -> None:
+        """
+        Add processed chunks to the results, in item order.
+        
+        Args:
+            chunk_outcomes: Outcomes of _process_chunk, one list per chunk
+            results: Results structure to update
+            preallocated: Whether results["results"] has a slot per item
+            result_sink: Receives item results instead of results["results"]
+        """
+        # Counted in locals and written back once; the containers are
+        # looked up once rather than per item
+        total = processed = warnings = error_count = 0
+        item_results = results["results"]
+        errors = results["errors"]
+        
+        for outcomes in chunk_outcomes:
+            for i, outcome in outcomes:
+                total += 1
+                
+                if isinstance(outcome, ItemResult):
+                    if result_sink is not None:
+                        result_sink(outcome)
+                    elif preallocated:
+                        item_results[i] = outcome
+                    else:
+                        item_results.append(outcome)
+                    processed += 1
+                    
+                    if outcome.status == "warning":
+                        warnings += 1
+                else:
+                    error_count += 1
+                    if error_count > self._MAX_ERRORS:
+                        continue
+                    
+                    logger.error("Error processing item %d: %s", i, outcome)
+                    error_info = ErrorInfo(
+                        item_id=f"item-{i}",
+                        error_type="processing_error",
+                        message=outcome
+                    )
+                    errors.append(error_info)
+        
+        suppressed = error_count - self._MAX_ERRORS
+        if suppressed > 0:
+            logger.error("%d more item errors suppressed", suppressed)
+            errors.append(ErrorInfo(
+                item_id="",
+                error_type="errors_suppressed",
+                message=f"{suppressed} more errors suppressed"
+            ))
+        
+        results["summary"].update(
+            total_items=total,
+            processed=processed,
+            errors=error_count,
+            warnings=warnings
+        )
+    
+    def _process_chunk(
+        self,
+        chunk: List[Tuple[int, Any]]
+    ) -> List[_Outcome]:
+        """
+        Process a chunk of (index, item) pairs.
+        
+        Args:
+            chunk: Items to process, with their indexes
+            
+        Returns:
+            (index, result) per item, with the error message as the result
+            for items that failed
+            
+        Raises:
+            Exception: In strict mode, whatever the first failing item raised
+        """
+        outcomes: List[_Outcome] = []
+        # Checked once per chunk so disabled debug logging costs nothing per item
+        log_items = logger.isEnabledFor(logging.DEBUG)
+        strict = self.strict
+        for index, item in chunk:
+            if log_items:
+                logger.debug("Processing item %d", index)
+            if strict:
+                # Trusted input: no per-item handler, the first failure aborts
+                outcomes.append((index, self._process_item(item, index)))
+                continue
+            try:
+                outcomes.append((index, self._process_item(item, index)))
+            except Exception as e:
+                outcomes.append((index, str(e)))
+        return outcomes
+    
+    def _process_item(self, item: Dict[str, Any], index: int) -> ItemResult:
         """
         Process a single item.
         
+        Identical items are analyzed once; repeats reuse a copy of the
+        memoized result under their own item_id. Items without an exact
+        JSON form are always analyzed afresh.
+        
         Args:
             item: Item to process
             index: Item index for tracking
@@ -159,19 +401,41 @@ class SkillTemplate:
         Returns:
             Processing result
         """
-        logger.debug(f"Processing item {index}")
+        key = self._cache_key(item)
+        analysis = self._cache.get(key) if key is not None else None
+        if analysis is None:
+            analysis = self._analyze_item(item)
+            if key is not None and len(self._cache) < self._CACHE_SIZE:
+                self._cache[key] = analysis
+        
+        return ItemResult(
+            item_id=f"item-{index}",
+            status=analysis["status"],
+            findings=copy.deepcopy(analysis["findings"]),
+            recommendations=list(analysis["recommendations"])
+        )
+    
+    def _analyze_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze a single item.
         
+        Args:
+            item: Item to analyze
+            
+        Returns:
+            Analysis result, without the item_id
+        """
         # Add your item processing logic here
         # This is just an example
-        result = {
-            "item_id": f"item-{index}",
+        result: Dict[str, Any] = {
             "status": "success",
             "findings": [],
             "recommendations": []
         }
         
         # Example analysis logic
-        if "security_issue" in str(item).lower():
+        blob = repr(item).encode('utf-8', 'backslashreplace').translate(_ASCII_LOWER)
+        if any(keyword in blob for keyword in self._KEYWORDS):
             result["status"] = "warning"
             result["findings"].append({
                 "type": "security",
@@ -180,12 +444,116 @@ class SkillTemplate:
             })
             result["recommendations"].append("Review security configuration")
         
+        # Example byte-level analysis of binary payloads
+        payload = item.get("payload") if isinstance(item, dict) else None
+        if isinstance(payload, (bytes, bytearray)):
+            histogram, entropy = scan_bytes(payload)
+            result["findings"].append({
+                "type": "payload",
+                "severity": "info",
+                "description": f"Payload entropy {entropy:.2f} bits/byte",
+                "entropy": entropy,
+                "distinct_bytes": sum(1 for count in histogram if count)
+            })
+        
         return result
     
+    @staticmethod
+    def _cache_key(item: Any) -> Optional[bytes]:
+        """
+        Hash an item's canonical (key-sorted) JSON form.
+        
+        Returns None for items JSON cannot represent exactly (bytes, tuples,
+        non-str keys, non-finite floats, ints orjson cannot encode, ...);
+        those are analyzed uncached so distinct items never share a key.
+        """
+        try:
+            if not _is_plain_json(item):
+                return None
+            if orjson is not None:
+                canonical = orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+            else:
+                canonical = json.dumps(item, sort_keys=True).encode('utf-8')
+        except (TypeError, ValueError, RecursionError):
+            return None
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+    
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat() + "Z"
+        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+# Skill instance owned by each worker process during parallel analysis
+_worker_skill: Optional[SkillTemplate] = None
+
+
+def _init_worker(skill: SkillTemplate) -> None:
+    """Install the (unpickled copy of the) analyzing skill in a worker process."""
+    global _worker_skill
+    if skill.debug:
+        # __init__ does not run on unpickling, so repeat its logging setup
+        logging.getLogger().setLevel(logging.DEBUG)
+    _worker_skill = skill
+
+
+def _process_chunk(chunk: List[Tuple[int, Any]]) -> List[_Outcome]:
+    """Process a chunk of items in a worker process."""
+    assert _worker_skill is not None, "worker not initialized"
+    return _worker_skill._process_chunk(chunk)
+
+
+def _map_bounded(
+    executor: ProcessPoolExecutor,
+    chunks: Iterable[List[Tuple[int, Any]]],
+    window: int
+) -> Iterator[List[_Outcome]]:
+    """
+    Process chunks in worker processes, yielding outcomes in chunk order.
+    
+    Unlike executor.map, which consumes the whole input up front, at most
+    window chunks are submitted ahead of the one being yielded.
+    
+    Args:
+        executor: Pool initialized with _init_worker
+        chunks: Chunks of (index, item) pairs
+        window: Maximum number of chunks in flight
+        
+    Yields:
+        Outcomes of each chunk
+    """
+    pending: Deque["Future[List[_Outcome]]"] = collections.deque()
+    try:
+        for chunk in chunks:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(_process_chunk, chunk))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Whether value is built only from types JSON represents exactly."""
+    kind = type(value)
+    if kind is dict:
+        return all(type(k) is str and _is_plain_json(v) for k, v in value.items())
+    if kind is list:
+        return all(_is_plain_json(v) for v in value)
+    if kind is float:
+        return math.isfinite(value)
+    return kind in (str, int, bool, type(None))
+
+
+def _chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most size elements."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
 
 def load_input(input_path: Path) -> Dict[str, Any]:
@@ -202,96 +570,274 @@ def load_input(input_path: Path) -> Dict[str, Any]:
         SkillTemplateError: If file cannot be loaded
     """
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
+        if input_path.suffix.lower() == '.json':
+            size = input_path.stat().st_size
+            if ijson is not None and size >= STREAM_THRESHOLD:
+                return _load_streaming(input_path)
+            if orjson is not None and size >= MMAP_THRESHOLD:
+                return _load_mapped(input_path)
+        
+        with open(input_path, 'rb') as f:
             if input_path.suffix.lower() == '.json':
-                return json.load(f)
+                return _parse_json(f.read())
             else:
                 # Handle other formats as needed
                 raise SkillTemplateError(f"Unsupported file format: {input_path.suffix}")
     except json.JSONDecodeError as e:
+        # orjson.JSONDecodeError is a subclass, so this covers both parsers
         raise SkillTemplateError(f"Invalid JSON in {input_path}: {e}")
     except FileNotFoundError:
         raise SkillTemplateError(f"Input file not found: {input_path}")
-    except Exception as e:
-        raise SkillTemplateError(f"Error loading input file: {e}")
+    except Exception as exc:
+        # A separate name: mypyc gives each exception variable one static type
+        raise SkillTemplateError(f"Error loading input file: {exc}")
+
+
+def _parse_json(raw: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when it can represent the input exactly.
+    
+    Inputs with very long digit runs (certificate serials, 128-bit IDs, ...)
+    are parsed by json instead, which keeps large integers exact.
+    """
+    if orjson is not None and not _LONG_DIGITS.search(raw):
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_mapped(input_path: Path) -> Any:
+    """
+    Parse a large JSON file through a read-only memory map.
+    
+    orjson parses the mapped pages directly, so the raw file is never copied
+    into a bytes object and the kernel can read ahead of the parser. Files
+    with very long digit runs are copied and parsed by json, as in _parse_json.
+    """
+    with open(input_path, 'rb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _LONG_DIGITS.search(mm):
+                return json.loads(mm[:])
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _load_streaming(input_path: Path) -> Dict[str, Any]:
+    """
+    Load a large JSON input without materializing its items.
+    
+    Top-level fields other than ``items`` are read in a first pass; ``items``
+    becomes a generator that parses one item at a time.
+    
+    Args:
+        input_path: Path to input file
+        
+    Returns:
+        Loaded data with a lazy ``items`` iterator
+    """
+    data: Dict[str, Any] = {}
+    key = ''
+    builder: Any = None
+    
+    with open(input_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == '':
+                if builder is not None:
+                    data[key] = builder.value
+                key, builder = '', None
+                if event == 'map_key':
+                    if value == 'items':
+                        data['items'] = None
+                    else:
+                        key, builder = value, ijson.ObjectBuilder()
+            elif builder is not None:
+                builder.event(event, value)
+    
+    if 'items' in data:
+        data['items'] = _iter_items(input_path)
+    return data
+
+
+def _iter_items(input_path: Path) -> Iterator[Any]:
+    """Yield the elements of the top-level ``items`` array one at a time."""
+    with open(input_path, 'rb') as f:
+        yield from ijson.items(f, 'items.item', use_float=True)
 
 
 def save_output(results: Dict[str, Any], output_path: Optional[Path], format_type: str) -> None:
     """
     Save results to file or stdout.
     
+    Output is written as it is produced rather than built up as one string
+    first, keeping peak memory low for large result sets.
+    
     Args:
         results: Results to save
         output_path: Output file path (None for stdout)
-        format_type: Output format (json, csv, text)
+        format_type: Output format (json, ndjson, csv, text)
     """
-    if format_type == "json":
-        output_data = json.dumps(results, indent=2, default=str)
-    elif format_type == "csv":
-        # Convert to CSV format (implement as needed)
-        output_data = _convert_to_csv(results)
-    elif format_type == "text":
-        # Convert to human-readable text
-        output_data = _convert_to_text(results)
+    if format_type == "ndjson":
+        # Same layout as stream_ndjson: one line per result, summary last
+        with _binary_output(output_path) as f:
+            for result in results.get("results", []):
+                f.write(_to_json_line(result))
+            f.write(_to_json_line(_summary_record(results)))
+    elif format_type == "json":
+        output_data = _to_json(results)
+        if output_path:
+            with open(output_path, 'wb') as f:
+                f.write(output_data)
+        else:
+            print(output_data.decode('utf-8'))
+    elif format_type in ("csv", "text"):
+        # Convert to CSV or human-readable text
+        convert = _convert_to_csv if format_type == "csv" else _convert_to_text
+        if output_path:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                convert(results, f)
+        else:
+            convert(results, sys.stdout)
     else:
         raise SkillTemplateError(f"Unsupported output format: {format_type}")
     
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(output_data)
         logger.info(f"Results saved to {output_path}")
+
+
+def stream_ndjson(
+    skill: SkillTemplate,
+    data: Dict[str, Any],
+    output_path: Optional[Path]
+) -> Dict[str, Any]:
+    """
+    Analyze data, writing each result as an NDJSON line as soon as it is ready.
+    
+    Results are never held in memory. The output has the same layout as
+    ``--format ndjson``: one line per result, then a final summary object
+    (metadata, summary, errors, warnings), which is only known once every
+    item is processed.
+    
+    Args:
+        skill: Skill instance to run
+        data: Input data to analyze
+        output_path: Output file path (None for stdout)
+        
+    Returns:
+        Analysis results, with an empty ``results`` list
+    """
+    with _binary_output(output_path) as f:
+        def write_result(result: ItemResult) -> None:
+            f.write(_to_json_line(result))
+        
+        results = skill.analyze(data, result_sink=write_result)
+        f.write(_to_json_line(_summary_record(results)))
+    
+    if output_path:
+        logger.info(f"Results saved to {output_path}")
+    return results
+
+
+@contextmanager
+def _binary_output(output_path: Optional[Path]) -> Iterator[BinaryIO]:
+    """Open output_path for binary writing, or write to stdout."""
+    if output_path:
+        with open(output_path, 'wb') as f:
+            yield f
     else:
-        print(output_data)
+        sys.stdout.flush()
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+
+
+def _summary_record(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Everything in results except the per-item results; the last NDJSON line."""
+    return {key: value for key, value in results.items() if key != "results"}
+
 
+def _to_json_line(obj: Any) -> bytes:
+    """Serialize obj as one compact line of UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_APPEND_NEWLINE,
+            default=str
+        )
+    return (json.dumps(obj, separators=(",", ":"), default=_json_default) + "\n").encode('utf-8')
 
-def _convert_to_csv(results: Dict[str, Any]) -> str:
-    """Convert results to CSV format."""
+
+def _to_json(results: Dict[str, Any]) -> bytes:
+    """Serialize results as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        # Dataclasses, datetimes and UUIDs are serialized natively, so default
+        # is only called for leftovers such as bytes and Path; naive datetimes
+        # are taken as UTC, like the report timestamp
+        return orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC,
+            default=str
+        )
+    return json.dumps(results, indent=2, default=_json_default).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values json cannot handle the way orjson would."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat()
+    return str(obj)
+
+
+def _convert_to_csv(results: Dict[str, Any], out: TextIO) -> None:
+    """Write results to out in CSV format."""
     # Implement CSV conversion as needed
     # This is a simple example
-    lines = ["item_id,status,findings,recommendations"]
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["item_id", "status", "findings", "recommendations"])
     for result in results.get("results", []):
-        item_id = result.get("item_id", "")
-        status = result.get("status", "")
-        findings = "; ".join([f["description"] for f in result.get("findings", [])])
-        recommendations = "; ".join(result.get("recommendations", []))
-        lines.append(f'"{item_id}","{status}","{findings}","{recommendations}"')
-    return "\n".join(lines)
+        writer.writerow([
+            result.item_id,
+            result.status,
+            "; ".join([f["description"] for f in result.findings]),
+            "; ".join(result.recommendations)
+        ])
 
 
-def _convert_to_text(results: Dict[str, Any]) -> str:
-    """Convert results to human-readable text."""
-    lines = []
+def _convert_to_text(results: Dict[str, Any], out: TextIO) -> None:
+    """Write results to out as human-readable text."""
+    write = out.write
     
     # Add summary
     summary = results.get("summary", {})
-    lines.append("=== Analysis Summary ===")
-    lines.append(f"Total items: {summary.get('total_items', 0)}")
-    lines.append(f"Processed: {summary.get('processed', 0)}")
-    lines.append(f"Errors: {summary.get('errors', 0)}")
-    lines.append(f"Warnings: {summary.get('warnings', 0)}")
-    lines.append("")
+    write("=== Analysis Summary ===\n")
+    write(f"Total items: {summary.get('total_items', 0)}\n")
+    write(f"Processed: {summary.get('processed', 0)}\n")
+    write(f"Errors: {summary.get('errors', 0)}\n")
+    write(f"Warnings: {summary.get('warnings', 0)}\n")
+    write("\n")
     
     # Add findings
     if results.get("results"):
-        lines.append("=== Detailed Results ===")
+        write("=== Detailed Results ===\n")
         for result in results["results"]:
-            lines.append(f"Item: {result.get('item_id', 'unknown')}")
-            lines.append(f"Status: {result.get('status', 'unknown')}")
+            write(f"Item: {result.item_id}\n")
+            write(f"Status: {result.status}\n")
             
-            findings = result.get("findings", [])
+            findings = result.findings
             if findings:
-                lines.append("Findings:")
+                write("Findings:\n")
                 for finding in findings:
-                    lines.append(f"  - {finding.get('description', 'No description')}")
+                    write(f"  - {finding.get('description', 'No description')}\n")
             
-            recommendations = result.get("recommendations", [])
+            recommendations = result.recommendations
             if recommendations:
-                lines.append("Recommendations:")
+                write("Recommendations:\n")
                 for rec in recommendations:
-                    lines.append(f"  - {rec}")
-            lines.append("")
-    
-    return "\n".join(lines)
+                    write(f"  - {rec}\n")
+            write("\n")
 
 
 def main() -> int:
@@ -299,7 +845,8 @@ def main() -> int:
     parser = argparse.ArgumentParser(
         description="Cybersecurity Skill Template",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__
+        # Read through the module object: mypyc builds have no docstring
+        epilog=sys.modules[__name__].__doc__
     )
     
     parser.add_argument(
@@ -316,11 +863,30 @@ def main() -> int:
     
     parser.add_argument(
         "--format", "-f",
-        choices=["json", "csv", "text"],
+        choices=["json", "ndjson", "csv", "text"],
         default="json",
         help="Output format (default: json)"
     )
     
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Worker processes for item analysis (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--stream-output",
+        action="store_true",
+        help="Write ndjson results as they are produced instead of after analysis (requires --format ndjson)"
+    )
+    
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Abort on the first item error instead of recording it"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -335,6 +901,9 @@ def main() -> int:
     
     args = parser.parse_args()
     
+    if args.stream_output and args.format != "ndjson":
+        parser.error("--stream-output requires --format ndjson")
+    
     # Configure logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.INFO)
@@ -347,11 +916,14 @@ def main() -> int:
         input_data = load_input(args.input)
         
         # Initialize and run skill
-        skill = SkillTemplate(debug=args.debug)
-        results = skill.analyze(input_data)
-        
-        # Save results
-        save_output(results, args.output, args.format)
+        skill = SkillTemplate(debug=args.debug, workers=args.workers, strict=args.strict)
+        if args.stream_output:
+            results = stream_ndjson(skill, input_data, args.output)
+        else:
+            results = skill.analyze(input_data)
+            
+            # Save results
+            save_output(results, args.output, args.format)
         
         # Return appropriate exit code
         if results["summary"]["errors"] > 0:
@@ -367,8 +939,8 @@ def main() -> int:
     except KeyboardInterrupt:
         logger.info("Analysis interrupted by user")
         return 1
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+    except Exception as exc:
+        logger.error(f"Unexpected error: {exc}")
         if args.debug:
             import traceback
             traceback.print_exc()
@@ -0,0 +1,48 @@
+"""Tests for the skill template's main script."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from main import SkillTemplate  # noqa: E402
+
+
+class FlagEverything(SkillTemplate):
+    """Subclass whose analysis differs from the base class."""
+
+    def __init__(self, label: str, **kwargs):
+        super().__init__(**kwargs)
+        self.label = label
+
+    def _analyze_item(self, item):
+        return {
+            "status": "warning",
+            "findings": [{"description": f"{self.label}: {item['id']}"}],
+            "recommendations": [],
+        }
+
+
+def _input(count: int) -> dict:
+    return {"example_field": 1, "items": [{"id": i % 50} for i in range(count)]}
+
+
+def _comparable(results: dict) -> dict:
+    """Results without the run timestamp."""
+    return {key: value for key, value in results.items() if key != "metadata"}
+
+
+def test_workers_match_in_process():
+    data = _input(1000)
+    serial = SkillTemplate(workers=1).analyze(data)
+    parallel = SkillTemplate(workers=2).analyze(data)
+    assert _comparable(parallel) == _comparable(serial)
+
+
+def test_workers_use_subclass_and_instance_state():
+    data = _input(1000)
+    serial = FlagEverything("custom", workers=1).analyze(data)
+    parallel = FlagEverything("custom", workers=2).analyze(data)
+    assert _comparable(parallel) == _comparable(serial)
+    assert parallel["summary"]["warnings"] == 1000
+    assert parallel["results"][7].findings == [{"description": "custom: 7"}]